@@ -2,8 +2,11 @@ import serial
 import serial.tools.list_ports
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+import math
+import threading
+from functools import lru_cache
 import numpy as np
-from collections import deque
+from numba import njit
 import sounddevice as sd
 from scipy import signal as scipy_signal
 
@@ -52,7 +55,13 @@ ax1 = fig.add_subplot(gs[0:2, :])  # Main spectrogram
 ax2 = fig.add_subplot(gs[2, 0])     # Waveform
 ax3 = fig.add_subplot(gs[2, 1])     # Effects display
 
-spectrogram_data = deque(maxlen=800)
+# Spectrogram history of (freq, x, y) rows. Every row is written twice, N
+# rows apart, so the latest N rows are always one contiguous slice.
+SPECTROGRAM_LENGTH = 800
+spectrogram_buffer = np.zeros((2 * SPECTROGRAM_LENGTH, 3), dtype=np.int32)
+spectrogram_index = 0
+spectrogram_filled = 0
+spectrogram_x = np.arange(SPECTROGRAM_LENGTH)
 min_freq, max_freq = 100, 2000
 
 # Vintage colors
@@ -66,6 +75,7 @@ RED = '#FF3333'
 
 # Audio settings
 SAMPLE_RATE = 44100
+BLOCK_SIZE = 1024
 current_freq = 440
 current_waveform = 0
 target_freq = 440
@@ -97,21 +107,39 @@ joy_x_value = 512
 joy_y_value = 512
 target_filter_cutoff = 1.0
 
-# Effect buffers
+# Effect buffers (power-of-two sizes so ring indices wrap with a mask)
+def _next_pow2(n):
+    return 1 << (int(n) - 1).bit_length()
+
 chorus_phase = 0.0
-chorus_delay_buffer = np.zeros(int(SAMPLE_RATE * 0.05))
+chorus_delay_buffer = np.zeros(_next_pow2(SAMPLE_RATE * 0.05), dtype=np.float32)
 chorus_buffer_index = 0
+CHORUS_MASK = len(chorus_delay_buffer) - 1
 
-reverb_buffer = np.zeros(int(SAMPLE_RATE * 0.5))
+reverb_buffer = np.zeros(_next_pow2(SAMPLE_RATE * 0.5), dtype=np.float32)
 reverb_buffer_index = 0
+REVERB_MASK = len(reverb_buffer) - 1
+REVERB_DELAY_SAMPLES = np.array([int(d * SAMPLE_RATE) for d in (0.029, 0.037, 0.041, 0.043)])
 
-delay_buffer = np.zeros(int(SAMPLE_RATE * 1.0))
+delay_buffer = np.zeros(_next_pow2(SAMPLE_RATE * 1.0), dtype=np.float32)
 delay_buffer_index = 0
+DELAY_MASK = len(delay_buffer) - 1
+
+# Preallocated per-block work arrays, so the effects write into these
+# instead of allocating temporaries in the audio callback
+_SCRATCH = {name: np.empty(BLOCK_SIZE, dtype=np.float32)
+            for name in ('t', 'wave', 'tmp1', 'effects')}
+
+# Time of each sample within a block, from the start of the block
+_t_template = (np.arange(BLOCK_SIZE) / SAMPLE_RATE).astype(np.float32)
 
 tremolo_phase = 0.0
 phaser_phase = 0.0
+ring_mod_phase = 0.0
 pwm_phase = 0.0
 
+filter_last_output = None
+
 print("\n" + "="*70)
 print("KEYBOARD CONTROLS - SYNTH WORKSTATION")
 print("="*70)
@@ -134,76 +162,142 @@ print("  SPACE - Reset all effects to default")
 print("  ESC   - Quit")
 print("="*70 + "\n")
 
+def _fractional_part(x):
+    """x - floor(x) for non-negative x, using integer truncation instead of np.floor"""
+    return np.subtract(x, x.astype(np.int32), dtype=x.dtype)
+
+def _sawtooth(t, freq):
+    return 2 * _fractional_part(t * freq + 0.5) - 1
+
+def _sine(t, freq):
+    return np.sin(2 * np.pi * (t * freq))
+
+def _square(t, freq):
+    phase = _fractional_part(t * freq)
+    return (phase < 0.5).astype(np.float32) * 2.0 - 1.0
+
+def _triangle(t, freq):
+    return 2 * np.abs(2 * _fractional_part(t * freq + 0.5) - 1) - 1
+
+def _pulse(t, freq):
+    """Pulse with 25% duty cycle"""
+    phase = _fractional_part(t * freq)
+    return (phase < 0.25).astype(np.float32) * 2.0 - 1.0
+
+def _white_noise(t, freq):
+    return np.random.uniform(-1, 1, len(t)).astype(np.float32)
+
+def _pwm_at(t, freq, lfo_time):
+    """Pulse width modulation at a given point of the LFO sweep (no side effects)"""
+    lfo = 0.5 + 0.4 * np.sin(2 * np.pi * 0.5 * lfo_time)
+    phase = _fractional_part(t * freq)
+    return (phase < lfo).astype(np.float32) * 2.0 - 1.0
+
+def _pwm(t, freq):
+    """Pulse width modulation, duty cycle swept by a 0.5 Hz LFO"""
+    global pwm_phase
+    wave = _pwm_at(t, freq, pwm_phase)
+    pwm_phase += len(t) / SAMPLE_RATE
+    return wave
+
+def _ramp(t, freq):
+    """Reverse sawtooth"""
+    return 1 - 2 * _fractional_part(t * freq + 0.5)
+
+# Indexed by waveform number, in the same order as waveform_names
+_WAVEFORMS = [_sawtooth, _sine, _square, _triangle, _pulse, _white_noise, _pwm, _ramp]
+
 def generate_base_waveform(t, freq, waveform_type):
     """Generate various waveform types"""
-    
-    if waveform_type == 0:  # Sawtooth
-        return 2 * (t * freq - np.floor(0.5 + t * freq))
-    
-    elif waveform_type == 1:  # Sine
-        return np.sin(2 * np.pi * freq * t)
-    
-    elif waveform_type == 2:  # Square
-        return np.sign(np.sin(2 * np.pi * freq * t))
-    
-    elif waveform_type == 3:  # Triangle
-        return 2 * np.abs(2 * (t * freq - np.floor(t * freq + 0.5))) - 1
-    
-    elif waveform_type == 4:  # Pulse (25% duty cycle)
-        phase = (t * freq) % 1.0
-        return np.where(phase < 0.25, 1.0, -1.0)
-    
-    elif waveform_type == 5:  # White Noise
-        return np.random.uniform(-1, 1, len(t))
-    
-    elif waveform_type == 6:  # PWM (Pulse Width Modulation)
-        global pwm_phase
-        lfo = 0.5 + 0.4 * np.sin(2 * np.pi * 0.5 * pwm_phase)
-        phase = (t * freq) % 1.0
-        pwm_phase += len(t) / SAMPLE_RATE
-        return np.where(phase < lfo, 1.0, -1.0)
-    
-    elif waveform_type == 7:  # Ramp (reverse sawtooth)
-        return -2 * (t * freq - np.floor(0.5 + t * freq))
+    if 0 <= waveform_type < len(_WAVEFORMS):
+        return _WAVEFORMS[waveform_type](t, freq)
     
     return np.zeros_like(t)
 
-def apply_harmonics(wave, freq, level):
-    """Add harmonic overtones"""
-    if level <= 0:
-        return wave
+# Wavetables: one period of each periodic waveform, sampled from the generators
+# above, plus a guard point equal to the first sample for interpolation.
+# Noise and PWM (which has its own LFO) are still generated directly.
+WAVETABLE_SIZE = 4096
+_wavetable_t = (np.arange(WAVETABLE_SIZE) / WAVETABLE_SIZE).astype(np.float32)
+_WAVETABLES = {}
+for _waveform_type in (0, 1, 2, 3, 4, 7):
+    _table = _WAVEFORMS[_waveform_type](_wavetable_t, 1.0).astype(np.float32)
+    _WAVETABLES[_waveform_type] = np.append(_table, _table[0])
+
+oscillator_phase = 0.0  # position in the wavetable, in table samples
+
+@njit(cache=True, fastmath=True)
+def _wavetable_kernel(table, output, phase, step):
+    """Linearly interpolated wavetable lookup driven by a phase accumulator"""
+    for i in range(len(output)):
+        j = int(phase)
+        frac = phase - j
+        output[i] = table[j] + frac * (table[j + 1] - table[j])
+        
+        phase += step
+        while phase >= WAVETABLE_SIZE:
+            phase -= WAVETABLE_SIZE
     
-    t = np.arange(len(wave)) / SAMPLE_RATE
-    harmonics = np.zeros_like(wave)
+    return phase
+
+def render_oscillator(t, freq, waveform_type):
+    """Render one block of the oscillator, from a wavetable where one exists"""
+    global oscillator_phase
     
-    harmonics += level * 0.5 * np.sin(2 * np.pi * freq * 2 * t)
-    harmonics += level * 0.33 * np.sin(2 * np.pi * freq * 3 * t)
-    harmonics += level * 0.25 * np.sin(2 * np.pi * freq * 4 * t)
-    harmonics += level * 0.2 * np.sin(2 * np.pi * freq * 5 * t)
-    harmonics += level * 0.17 * np.sin(2 * np.pi * freq * 6 * t)
+    step = freq * WAVETABLE_SIZE / SAMPLE_RATE
+    table = _WAVETABLES.get(waveform_type)
+    if table is None:
+        # Keep the phase running so the harmonics stay continuous
+        oscillator_phase = (oscillator_phase + len(t) * step) % WAVETABLE_SIZE
+        return generate_base_waveform(t, freq, waveform_type)
     
-    return wave + harmonics
+    wave = _SCRATCH['wave'][:len(t)]
+    oscillator_phase = _wavetable_kernel(table, wave, oscillator_phase, step)
+    return wave
 
-def apply_distortion(wave, amount):
-    """Balanced wub-wub distortion using waveshaping"""
-    if amount <= 0:
-        return wave
+HARMONIC_AMPLITUDES = (0.5, 0.33, 0.25, 0.2, 0.17)  # harmonics 2 to 6
+
+@njit(cache=True, fastmath=True)
+def _harmonics_kernel(wave, phase, step, level):
+    """Add harmonics 2-6 in one pass from a single sin/cos per sample.
     
+    Higher harmonics follow from sin(kx) = 2cos(x)sin((k-1)x) - sin((k-2)x).
+    phase and step are the fundamental's starting phase and per-sample
+    increment, in radians.
+    """
+    for i in range(len(wave)):
+        x = phase + i * step
+        two_cos = 2 * math.cos(x)
+        previous = math.sin(x)  # sin(x)
+        current = two_cos * previous  # sin(2x)
+        
+        harmonics = HARMONIC_AMPLITUDES[0] * current
+        for amplitude in HARMONIC_AMPLITUDES[1:]:
+            previous, current = current, two_cos * current - previous
+            harmonics += amplitude * current
+        
+        wave[i] += level * harmonics
+
+def apply_harmonics(wave, start_phase, freq, level):
+    """Add harmonic overtones locked to the oscillator, from its phase at the block start (in place)"""
+    _harmonics_kernel(wave, 2 * math.pi * start_phase / WAVETABLE_SIZE,
+                      2 * math.pi * freq / SAMPLE_RATE, level)
+    return wave
+
+def _distortion_curve(x, amount):
+    """Balanced wub-wub waveshaping curve, without the dry blend"""
     # Moderate gain for musical distortion
     gain = 1 + amount * 8
-    driven = wave * gain
     
     # Smooth waveshaping using multiple tanh stages for warmth
-    stage1 = np.tanh(driven * 0.8)
-    stage2 = np.tanh(stage1 * 1.2) * 0.9
+    output = np.tanh(x * gain * 0.8)
+    output = np.tanh(output * 1.2) * 0.9
     
     # Wub-wub effect: smooth wavefolder
     if amount > 0.3:
         fold_intensity = (amount - 0.3) * 1.4
-        folded = np.sin(stage2 * np.pi * (1 + fold_intensity))
-        output = stage2 * (1 - fold_intensity * 0.6) + folded * (fold_intensity * 0.6)
-    else:
-        output = stage2
+        folded = np.sin(output * np.pi * (1 + fold_intensity))
+        output = output * (1 - fold_intensity * 0.6) + folded * fold_intensity * 0.6
     
     # Add subtle harmonic enhancement
     if amount > 0.5:
@@ -212,166 +306,198 @@ def apply_distortion(wave, amount):
         output = output * (1 - harmonic_mix) + enhanced * harmonic_mix
     
     # Final gentle saturation
-    output = np.tanh(output * 1.1) * 0.95
-    
+    return np.tanh(output * 1.1) * 0.95
+
+# The curve only depends on the distortion level, which moves in 0.1 steps,
+# so it is sampled once per level into a table over [-4, 4]. Inputs beyond
+# that range are clipped to the end of the table, where the curve has
+# already saturated.
+DISTORTION_LUT_SIZE = 4096
+DISTORTION_LUT_RANGE = 4.0
+_distortion_x = np.linspace(-DISTORTION_LUT_RANGE, DISTORTION_LUT_RANGE,
+                            DISTORTION_LUT_SIZE, dtype=np.float32)
+_DIST_LUT = {}  # round(amount * 10) -> curve table with one guard sample
+
+def distortion_lut(amount):
+    """Curve table for the given distortion level, built on first use"""
+    key = round(amount * 10)
+    lut = _DIST_LUT.get(key)
+    if lut is None:
+        curve = _distortion_curve(_distortion_x, key / 10).astype(np.float32)
+        lut = _DIST_LUT[key] = np.append(curve, curve[-1])
+    return lut
+
+@njit(cache=True, fastmath=True)
+def _distortion_kernel(wave, lut, dry_mix):
+    """Shape wave through the curve table with linear interpolation, blending in dry signal"""
+    scale = (DISTORTION_LUT_SIZE - 1) / (2 * DISTORTION_LUT_RANGE)
+    for i in range(len(wave)):
+        position = (wave[i] + DISTORTION_LUT_RANGE) * scale
+        position = min(max(position, 0.0), DISTORTION_LUT_SIZE - 1)
+        j = int(position)
+        frac = position - j
+        wet = lut[j] + frac * (lut[j + 1] - lut[j])
+        
+        wave[i] = wave[i] * dry_mix + wet * (1 - dry_mix)
+
+def apply_distortion(wave, amount):
+    """Balanced wub-wub distortion using waveshaping (in place)"""
     # Blend with dry signal
     dry_mix = 0.15 * (1 - amount)
-    output = output * (1 - dry_mix) + wave * dry_mix
+    _distortion_kernel(wave, distortion_lut(amount), dry_mix)
     
-    return output
+    return wave
 
-def apply_chorus(wave, depth, rate):
-    """Chorus with delay modulation"""
-    global chorus_phase, chorus_delay_buffer, chorus_buffer_index
-    
-    if depth <= 0:
-        return wave
-    
-    output = np.zeros_like(wave)
-    
+def apply_ring_modulator(wave, freq, mod_freq):
+    """Ring modulation for metallic/bell tones (in place)"""
+    global ring_mod_phase
+    
+    # Carrier phase is carried across blocks so frequency changes don't click
+    omega = 2 * np.pi * (freq + mod_freq * 100)
+    modulator = _SCRATCH['tmp1'][:len(wave)]
+    np.multiply(_t_template[:len(wave)], omega, out=modulator)
+    modulator += ring_mod_phase
+    np.sin(modulator, out=modulator)
+    wave *= modulator
+    
+    ring_mod_phase = (ring_mod_phase + omega * len(wave) / SAMPLE_RATE) % (2 * np.pi)
+    return wave
+
+@njit(cache=True, fastmath=True)
+def _time_effects_kernel(wave, output,
+                         tremolo_phase, tremolo_depth, tremolo_rate,
+                         phaser_depth, phaser_delay,
+                         chorus_buffer, chorus_index, chorus_phase, chorus_depth, chorus_rate,
+                         delay_buffer, delay_index, delay_samples, delay_mix,
+                         reverb_buffer, reverb_index, reverb_delays, reverb_level):
+    """Tremolo -> phaser -> chorus -> delay -> reverb in a single pass.
+    
+    wave is overwritten with the tremolo stage, which the phaser reads back
+    from earlier samples of the block.
+    """
     for i in range(len(wave)):
-        lfo = np.sin(2 * np.pi * rate * chorus_phase)
-        delay_samples = int(0.002 * SAMPLE_RATE + depth * 0.01 * SAMPLE_RATE * (lfo + 1) / 2)
-        delay_samples = max(1, min(delay_samples, len(chorus_delay_buffer) - 1))
+        s = wave[i]
         
-        read_index = (chorus_buffer_index - delay_samples) % len(chorus_delay_buffer)
-        delayed = chorus_delay_buffer[read_index]
+        # Tremolo
+        if tremolo_depth > 0:
+            s *= 1 - tremolo_depth * (0.5 + 0.5 * math.sin(2 * math.pi * tremolo_rate * tremolo_phase))
+            tremolo_phase += 1.0 / SAMPLE_RATE
+            if tremolo_phase > 1.0:
+                tremolo_phase -= 1.0
+            wave[i] = s
         
-        output[i] = wave[i] * 0.6 + delayed * 0.4
+        # Phaser
+        if phaser_depth > 0 and i >= phaser_delay:
+            s += phaser_depth * wave[i - phaser_delay]
         
-        chorus_delay_buffer[chorus_buffer_index] = wave[i]
-        chorus_buffer_index = (chorus_buffer_index + 1) % len(chorus_delay_buffer)
+        # Chorus
+        if chorus_depth > 0:
+            lfo = math.sin(2 * math.pi * chorus_rate * chorus_phase)
+            d = int(0.002 * SAMPLE_RATE + chorus_depth * 0.01 * SAMPLE_RATE * (lfo + 1) / 2)
+            d = max(1, min(d, CHORUS_MASK))
+            
+            delayed = chorus_buffer[(chorus_index - d) & CHORUS_MASK]
+            chorus_buffer[chorus_index] = s
+            chorus_index = (chorus_index + 1) & CHORUS_MASK
+            s = s * 0.6 + delayed * 0.4
+            
+            chorus_phase += chorus_rate / SAMPLE_RATE
+            if chorus_phase > 1.0:
+                chorus_phase -= 1.0
         
-        chorus_phase += rate / SAMPLE_RATE
-        if chorus_phase > 1.0:
-            chorus_phase -= 1.0
-    
-    return output
-
-def apply_reverb(wave, level):
-    """Simple reverb using comb filters"""
-    global reverb_buffer, reverb_buffer_index
-    
-    if level <= 0:
-        return wave
-    
-    output = np.zeros_like(wave)
-    delays = [0.029, 0.037, 0.041, 0.043]
-    
-    for i in range(len(wave)):
-        reverb_sum = 0
-        for delay in delays:
-            delay_samples = int(delay * SAMPLE_RATE)
-            read_index = (reverb_buffer_index - delay_samples) % len(reverb_buffer)
-            reverb_sum += reverb_buffer[read_index] * 0.25
+        # Delay
+        if delay_mix > 0:
+            delayed = delay_buffer[(delay_index - delay_samples) & DELAY_MASK]
+            delay_buffer[delay_index] = s + delayed * 0.4
+            delay_index = (delay_index + 1) & DELAY_MASK
+            s = s * (1 - delay_mix) + delayed * delay_mix
         
-        output[i] = wave[i] + reverb_sum * level
-        reverb_buffer[reverb_buffer_index] = wave[i] + reverb_sum * 0.5
-        reverb_buffer_index = (reverb_buffer_index + 1) % len(reverb_buffer)
+        # Reverb
+        if reverb_level > 0:
+            reverb_sum = 0.0
+            for d in reverb_delays:
+                reverb_sum += reverb_buffer[(reverb_index - d) & REVERB_MASK] * 0.25
+            reverb_buffer[reverb_index] = s + reverb_sum * 0.5
+            reverb_index = (reverb_index + 1) & REVERB_MASK
+            s = s + reverb_sum * reverb_level
+        
+        output[i] = s
     
-    return output
+    return tremolo_phase, chorus_index, chorus_phase, delay_index, reverb_index
 
-def apply_delay(wave, mix, delay_time):
-    """Tape-style delay effect"""
+def apply_time_effects(wave, tremolo_depth, tremolo_rate, phaser_depth,
+                       chorus_depth, chorus_rate, delay_mix, delay_time, reverb_level):
+    """Tremolo, phaser, chorus, delay and reverb fused into one sample loop"""
+    global tremolo_phase, phaser_phase
+    global chorus_phase, chorus_delay_buffer, chorus_buffer_index
     global delay_buffer, delay_buffer_index
+    global reverb_buffer, reverb_buffer_index
     
-    if mix <= 0:
-        return wave
+    # Phaser sweep is evaluated once per block
+    phaser_delay = 0
+    if phaser_depth > 0:
+        lfo = 0.5 + 0.5 * np.sin(2 * np.pi * 0.5 * phaser_phase)
+        phaser_delay = int((2 + lfo * 8) * 0.001 * SAMPLE_RATE)
+        phaser_phase += len(wave) / SAMPLE_RATE
     
-    output = np.zeros_like(wave)
     delay_samples = int(delay_time * SAMPLE_RATE)
-    delay_samples = min(delay_samples, len(delay_buffer) - 1)
-    
-    for i in range(len(wave)):
-        read_index = (delay_buffer_index - delay_samples) % len(delay_buffer)
-        delayed = delay_buffer[read_index]
-        
-        output[i] = wave[i] * (1 - mix) + delayed * mix
-        delay_buffer[delay_buffer_index] = wave[i] + delayed * 0.4
-        delay_buffer_index = (delay_buffer_index + 1) % len(delay_buffer)
-    
-    return output
-
-def apply_ring_modulator(wave, freq, mod_freq):
-    """Ring modulation for metallic/bell tones"""
-    if mod_freq <= 0:
-        return wave
-    
-    t = np.arange(len(wave)) / SAMPLE_RATE
-    modulator = np.sin(2 * np.pi * (freq + mod_freq * 100) * t)
-    return wave * modulator
-
-def apply_tremolo(wave, depth, rate):
-    """Amplitude modulation tremolo"""
-    global tremolo_phase
-    
-    if depth <= 0:
-        return wave
-    
-    output = np.zeros_like(wave)
-    
-    for i in range(len(wave)):
-        lfo = 1 - depth * (0.5 + 0.5 * np.sin(2 * np.pi * rate * tremolo_phase))
-        output[i] = wave[i] * lfo
-        tremolo_phase += 1.0 / SAMPLE_RATE
-        if tremolo_phase > 1.0:
-            tremolo_phase -= 1.0
-    
-    return output
-
-def apply_phaser(wave, depth):
-    """Phaser effect using all-pass filters"""
-    global phaser_phase
-    
-    if depth <= 0:
-        return wave
-    
-    lfo = 0.5 + 0.5 * np.sin(2 * np.pi * 0.5 * phaser_phase)
-    delay_samples = int((2 + lfo * 8) * 0.001 * SAMPLE_RATE)
-    
-    output = np.zeros_like(wave)
-    for i in range(len(wave)):
-        if i >= delay_samples:
-            output[i] = wave[i] + depth * wave[i - delay_samples]
-        else:
-            output[i] = wave[i]
-    
-    phaser_phase += len(wave) / SAMPLE_RATE
+    delay_samples = min(delay_samples, DELAY_MASK)
+    
+    output = _SCRATCH['effects'][:len(wave)]
+    (tremolo_phase, chorus_buffer_index, chorus_phase,
+     delay_buffer_index, reverb_buffer_index) = _time_effects_kernel(
+        wave, output,
+        tremolo_phase, tremolo_depth, tremolo_rate,
+        phaser_depth, phaser_delay,
+        chorus_delay_buffer, chorus_buffer_index, chorus_phase, chorus_depth, chorus_rate,
+        delay_buffer, delay_buffer_index, delay_samples, delay_mix,
+        reverb_buffer, reverb_buffer_index, REVERB_DELAY_SAMPLES, reverb_level)
     
     return output
 
 def apply_bit_crushing(wave, bits):
-    """Reduce bit depth for lo-fi digital sound"""
-    if bits >= 16:
-        return wave
-    
+    """Reduce bit depth for lo-fi digital sound (in place)"""
     levels = 2 ** bits
-    crushed = np.round(wave * levels) / levels
-    return crushed
+    wave *= levels
+    np.round(wave, out=wave)
+    wave /= levels
+    return wave
 
 def apply_filter(wave, cutoff):
     """Low-pass filter"""
+    global filter_last_output
+    
     if cutoff >= 1.0:
+        filter_last_output = None
         return wave
     
     alpha = cutoff
-    filtered = np.zeros_like(wave)
-    filtered[0] = wave[0]
+    b = np.array([alpha], dtype=np.float32)
+    a = np.array([1.0, -(1.0 - alpha)], dtype=np.float32)
+    
+    # Seed the filter with the previous block's last output so blocks join without clicks
+    if filter_last_output is None:
+        filter_last_output = wave[0]
+    zi = scipy_signal.lfiltic(b, a, [filter_last_output])
     
-    for i in range(1, len(wave)):
-        filtered[i] = alpha * wave[i] + (1 - alpha) * filtered[i-1]
+    filtered, _ = scipy_signal.lfilter(b, a, wave, zi=zi)
+    filter_last_output = filtered[-1]
     
     return filtered
 
-# Audio callback
+# Block synthesis (runs on the DSP worker thread)
 phase = 0.0
+peak_estimate = 0.0
+PEAK_RELEASE_TIME = 0.5  # seconds for the normalization peak to decay by 1/e
+PEAK_RELEASE = math.exp(-BLOCK_SIZE / (SAMPLE_RATE * PEAK_RELEASE_TIME))  # per-block decay
 
-def audio_callback(outdata, frames, time_info, status):
+def synthesize_block(out, frames):
+    """Render the next block of the synth into out (1-D float32, length frames)"""
     global current_freq, current_waveform, phase, target_freq
     global harmonics_level, distortion_level, chorus_depth, chorus_rate
     global bit_depth, filter_cutoff, volume, reverb_level, delay_mix
     global delay_time, ring_mod_freq, tremolo_depth, tremolo_rate, phaser_depth
-    global target_filter_cutoff
+    global target_filter_cutoff, peak_estimate
     
     # Smooth frequency transition
     current_freq = current_freq * 0.95 + target_freq * 0.05
@@ -379,43 +505,116 @@ def audio_callback(outdata, frames, time_info, status):
     # Smooth filter cutoff transition (from joystick Y-axis)
     filter_cutoff = filter_cutoff * 0.9 + target_filter_cutoff * 0.1
     
-    t = (np.arange(frames) + phase) / SAMPLE_RATE
+    # Block time vector, shared by the oscillator and the effects below
+    t = np.add(_t_template[:frames], np.float32(phase / SAMPLE_RATE), out=_SCRATCH['t'][:frames])
     
     # Generate base waveform
-    wave = generate_base_waveform(t, current_freq, current_waveform)
-    
-    # Apply effects chain
-    wave = apply_harmonics(wave, current_freq, harmonics_level)
-    wave = apply_ring_modulator(wave, current_freq, ring_mod_freq)
-    wave = apply_distortion(wave, distortion_level)
-    wave = apply_tremolo(wave, tremolo_depth, tremolo_rate)
-    wave = apply_phaser(wave, phaser_depth)
-    wave = apply_chorus(wave, chorus_depth, chorus_rate)
-    wave = apply_delay(wave, delay_mix, delay_time)
-    wave = apply_reverb(wave, reverb_level)
-    wave = apply_bit_crushing(wave, int(bit_depth))
+    start_phase = oscillator_phase
+    wave = render_oscillator(t, current_freq, current_waveform)
+    
+    # Apply effects chain, dispatching only the stages that are switched on.
+    # These checks are the only bypass: the apply_* stages assume they are on.
+    if harmonics_level > 0:
+        wave = apply_harmonics(wave, start_phase, current_freq, harmonics_level)
+    if ring_mod_freq > 0:
+        wave = apply_ring_modulator(wave, current_freq, ring_mod_freq)
+    if distortion_level > 0:
+        wave = apply_distortion(wave, distortion_level)
+    if tremolo_depth > 0 or phaser_depth > 0 or chorus_depth > 0 or delay_mix > 0 or reverb_level > 0:
+        wave = apply_time_effects(wave, tremolo_depth, tremolo_rate, phaser_depth,
+                                  chorus_depth, chorus_rate, delay_mix, delay_time, reverb_level)
+    if bit_depth < 16:
+        wave = apply_bit_crushing(wave, int(bit_depth))
+    # Always called: the filter clears its block-to-block state while bypassed
     wave = apply_filter(wave, filter_cutoff)
     
     # Update phase
     phase = (phase + frames) % SAMPLE_RATE
     
-    # Normalize and apply volume
-    if np.max(np.abs(wave)) > 0:
-        wave = wave / np.max(np.abs(wave))
+    # Normalize against a slowly released peak estimate and apply volume
+    block_peak = max(float(wave.max()), -float(wave.min()))
+    peak_estimate = max(block_peak, peak_estimate * PEAK_RELEASE)
+    gain = volume / max(peak_estimate, 1e-3)
+    
+    np.multiply(wave, gain, out=out)
+
+# Lock-free single-producer/single-consumer ring between the DSP worker and the
+# audio callback. Each side only advances its own position counter, and the
+# worker keeps AUDIO_RING_AHEAD samples rendered so GUI or serial work holding
+# the GIL cannot starve the real-time callback.
+AUDIO_RING_SIZE = BLOCK_SIZE * 8
+AUDIO_RING_MASK = AUDIO_RING_SIZE - 1
+AUDIO_RING_AHEAD = BLOCK_SIZE * 4
+audio_ring = np.zeros(AUDIO_RING_SIZE, dtype=np.float32)
+ring_read_position = 0   # samples consumed by the audio callback
+ring_write_position = 0  # samples produced by the DSP worker
+
+dsp_wakeup = threading.Event()
+dsp_running = True
+
+def dsp_worker():
+    """Keep the audio ring topped up, sleeping until the callback drains it"""
+    global ring_write_position
+    
+    while dsp_running:
+        if ring_write_position - ring_read_position >= AUDIO_RING_AHEAD:
+            # The timeout covers a wakeup that lands between wait() and clear()
+            dsp_wakeup.wait(timeout=BLOCK_SIZE / SAMPLE_RATE)
+            dsp_wakeup.clear()
+            continue
+        
+        start = ring_write_position & AUDIO_RING_MASK
+        synthesize_block(audio_ring[start:start + BLOCK_SIZE], BLOCK_SIZE)
+        ring_write_position += BLOCK_SIZE
+
+def stop_dsp_worker():
+    global dsp_running
+    dsp_running = False
+    dsp_wakeup.set()
+
+def audio_callback(outdata, frames, time_info, status):
+    """Copy rendered samples out of the audio ring; no DSP, allocation or I/O here"""
+    global ring_read_position
     
-    outdata[:, 0] = wave * volume
+    if ring_write_position - ring_read_position < frames:
+        # Underrun: the worker fell behind, so play silence rather than stale audio
+        outdata.fill(0)
+    else:
+        start = ring_read_position & AUDIO_RING_MASK
+        first = min(frames, AUDIO_RING_SIZE - start)
+        outdata[:first, 0] = audio_ring[start:start + first]
+        outdata[first:, 0] = audio_ring[:frames - first]
+        ring_read_position += frames
+    
+    dsp_wakeup.set()
+
+# Compile the kernels now rather than on the first block that uses them
+_warmup = np.zeros(BLOCK_SIZE, dtype=np.float32)
+_time_effects_kernel(_warmup, np.empty_like(_warmup),
+                     0.0, 0.1, 1.0, 0.1, 1,
+                     np.zeros_like(chorus_delay_buffer), 0, 0.0, 0.1, 1.0,
+                     np.zeros_like(delay_buffer), 0, 1, 0.1,
+                     np.zeros_like(reverb_buffer), 0, REVERB_DELAY_SAMPLES, 0.1)
+_wavetable_kernel(_WAVETABLES[0], np.empty_like(_warmup), 0.0, 1.0)
+_harmonics_kernel(np.zeros_like(_warmup), 0.0, 0.06, 0.1)
+_distortion_kernel(np.zeros_like(_warmup), distortion_lut(0.5), 0.1)
+
+# Start the DSP worker, then the audio stream that drains it
+dsp_thread = threading.Thread(target=dsp_worker, daemon=True)
+dsp_thread.start()
 
-# Start audio stream
 stream = sd.OutputStream(
     samplerate=SAMPLE_RATE,
     channels=1,
+    dtype='float32',
     callback=audio_callback,
-    blocksize=1024
+    blocksize=BLOCK_SIZE
 )
 stream.start()
 
 last_x_value = 512
 last_y_value = 512
+serial_remainder = b''
 
 # Keyboard event handler
 def on_key_press(event):
@@ -559,11 +758,13 @@ def on_key_press(event):
         tremolo_rate = 4.0
         phaser_depth = 0.0
         volume = 0.35
+        _DIST_LUT.clear()
         print("\n>>> ALL EFFECTS RESET <<<\n")
     
     # Quit
     elif key == 'escape':
         print("Quitting...")
+        stop_dsp_worker()
         stream.stop()
         stream.close()
         arduino.close()
@@ -571,112 +772,76 @@ def on_key_press(event):
 
 fig.canvas.mpl_connect('key_press_event', on_key_press)
 
-def animate(frame):
-    global current_freq, current_waveform, target_freq
-    global joy_x_value, joy_y_value, last_x_value, last_y_value
-    global target_filter_cutoff
-    
-    # Read serial data
-    while arduino.in_waiting > 0:
-        try:
-            line = arduino.readline().decode().strip()
-            if not line:
-                continue
-                
-            parts = line.split(',')
-            
-            if len(parts) >= 4:
-                freq = int(parts[0])
-                x_value = int(parts[1])
-                y_value = int(parts[2])
-                waveform_type = int(parts[3])
-                
-                # Update state
-                waveform_type = waveform_type % 8
-                target_freq = freq
-                current_waveform = waveform_type
-                joy_x_value = x_value
-                joy_y_value = y_value
-                
-                # Map Y-axis to filter cutoff (inverted: up = brighter, down = darker)
-                target_filter_cutoff = np.interp(y_value, [0, 1023], [0.1, 1.0])
-                
-                spectrogram_data.append((freq, x_value, y_value))
-        except Exception as e:
-            pass
-    
-    # Clear axes
-    ax1.clear()
-    ax2.clear()
-    ax3.clear()
-    
-    # SPECTROGRAM (ax1)
-    ax1.set_facecolor('#000000')
-    ax1.set_xlim(0, 800)
-    ax1.set_ylim(min_freq - 100, max_freq + 100)
-    ax1.grid(True, color=GRID_GREEN, linestyle='-', linewidth=0.5, alpha=0.3)
-    ax1.set_ylabel('FREQUENCY [Hz]', color=PHOSPHOR_GREEN, fontsize=12, family='monospace')
-    ax1.set_title('◢◤ FREQUENCY SPECTROGRAM ◥◣', color=PHOSPHOR_GREEN, 
-                  fontsize=18, family='monospace', weight='bold', pad=20)
-    
-    if spectrogram_data:
-        x_vals = list(range(len(spectrogram_data)))
-        y_vals = [d[0] for d in spectrogram_data]
-        
-        ax1.plot(x_vals, y_vals, color=PHOSPHOR_GREEN, linewidth=2, alpha=0.8)
-        ax1.plot(x_vals, y_vals, color=PHOSPHOR_GREEN, linewidth=4, alpha=0.3)
-        ax1.plot(x_vals, y_vals, color=PHOSPHOR_GREEN, linewidth=6, alpha=0.1)
-        
-        for i in range(min_freq, max_freq, 50):
-            ax1.axhline(y=i, color=DIM_GREEN, linewidth=0.3, alpha=0.2)
-    
-    ax1.tick_params(colors=PHOSPHOR_GREEN, labelsize=10)
-    for spine in ax1.spines.values():
-        spine.set_edgecolor(GRID_GREEN)
-        spine.set_linewidth(2)
-    
-    # WAVEFORM (ax2)
-    ax2.set_facecolor('#000000')
-    
-    display_freq = int(current_freq)
-    if display_freq > 0:
-        cycles = 3
-        t = np.linspace(0, cycles/display_freq, 2000)
-        
-        wave = generate_base_waveform(t, display_freq, current_waveform)
-        
-        t_ms = t * 1000
-        
-        ax2.plot(t_ms, wave, color=PHOSPHOR_GREEN, linewidth=2, alpha=0.9)
-        ax2.plot(t_ms, wave, color=PHOSPHOR_GREEN, linewidth=4, alpha=0.3)
-        
-        for i in np.linspace(-1, 1, 20):
-            ax2.axhline(y=i, color=DIM_GREEN, linewidth=0.3, alpha=0.15)
-        
-        ax2.set_ylim(-1.3, 1.3)
-        ax2.set_xlim(0, max(t_ms))
-        ax2.grid(True, color=GRID_GREEN, linestyle='-', linewidth=0.5, alpha=0.3)
-        ax2.set_xlabel('TIME [ms]', color=PHOSPHOR_GREEN, fontsize=10, family='monospace')
-        ax2.set_ylabel('AMP', color=PHOSPHOR_GREEN, fontsize=10, family='monospace')
-        
-        joy_x_percent = int(joy_x_value / 1023.0 * 100)
-        joy_y_percent = int(joy_y_value / 1023.0 * 100)
-        title_text = f'{waveform_names[current_waveform]} | {display_freq} Hz | X:{joy_x_percent}% Y:{joy_y_percent}%'
-        ax2.set_title(title_text, color=PHOSPHOR_GREEN, 
-                     fontsize=12, family='monospace', weight='bold')
-    
-    ax2.tick_params(colors=PHOSPHOR_GREEN, labelsize=9)
-    for spine in ax2.spines.values():
-        spine.set_edgecolor(GRID_GREEN)
-        spine.set_linewidth(2)
-    
-    # EFFECTS DISPLAY (ax3)
-    ax3.set_facecolor('#000000')
-    ax3.set_xlim(0, 10)
-    ax3.set_ylim(0, 15)
-    ax3.axis('off')
-    
-    # Organized effects in columns
+# DISPLAY SETUP
+# Static decorations are drawn once; animate() only updates the artists
+# created here and returns them for blitting.
+
+# SPECTROGRAM (ax1)
+ax1.set_facecolor('#000000')
+ax1.set_xlim(0, SPECTROGRAM_LENGTH)
+ax1.set_ylim(min_freq - 100, max_freq + 100)
+ax1.grid(True, color=GRID_GREEN, linestyle='-', linewidth=0.5, alpha=0.3)
+ax1.set_ylabel('FREQUENCY [Hz]', color=PHOSPHOR_GREEN, fontsize=12, family='monospace')
+ax1.set_title('◢◤ FREQUENCY SPECTROGRAM ◥◣', color=PHOSPHOR_GREEN, 
+              fontsize=18, family='monospace', weight='bold', pad=20)
+
+for i in range(min_freq, max_freq, 50):
+    ax1.axhline(y=i, color=DIM_GREEN, linewidth=0.3, alpha=0.2)
+
+ax1.tick_params(colors=PHOSPHOR_GREEN, labelsize=10)
+for spine in ax1.spines.values():
+    spine.set_edgecolor(GRID_GREEN)
+    spine.set_linewidth(2)
+
+spectrogram_line, = ax1.plot([], [], color=PHOSPHOR_GREEN, linewidth=2, alpha=0.8)
+spectrogram_glow, = ax1.plot([], [], color=PHOSPHOR_GREEN, linewidth=5, alpha=0.2)
+
+# WAVEFORM (ax2)
+# Fixed axis of 3 cycles so limits and ticks never change while blitting
+PREVIEW_CYCLES = 3
+PREVIEW_POINTS = 200
+preview_x = np.linspace(0, PREVIEW_CYCLES, PREVIEW_POINTS)
+
+@lru_cache(maxsize=None)
+def wavetable_preview(waveform_type):
+    """Preview trace sampled straight from a wavetable (independent of frequency on a cycles axis)"""
+    table = _WAVETABLES[waveform_type]
+    return table[(preview_x * WAVETABLE_SIZE).astype(np.int32) & (WAVETABLE_SIZE - 1)]
+
+ax2.set_facecolor('#000000')
+
+for i in np.linspace(-1, 1, 20):
+    ax2.axhline(y=i, color=DIM_GREEN, linewidth=0.3, alpha=0.15)
+
+ax2.set_ylim(-1.3, 1.3)
+ax2.set_xlim(0, PREVIEW_CYCLES)
+ax2.grid(True, color=GRID_GREEN, linestyle='-', linewidth=0.5, alpha=0.3)
+ax2.set_xlabel('CYCLES', color=PHOSPHOR_GREEN, fontsize=10, family='monospace')
+ax2.set_ylabel('AMP', color=PHOSPHOR_GREEN, fontsize=10, family='monospace')
+ax2.set_title('◢◤ WAVEFORM ◥◣', color=PHOSPHOR_GREEN, 
+              fontsize=12, family='monospace', weight='bold')
+
+ax2.tick_params(colors=PHOSPHOR_GREEN, labelsize=9)
+for spine in ax2.spines.values():
+    spine.set_edgecolor(GRID_GREEN)
+    spine.set_linewidth(2)
+
+waveform_line, = ax2.plot([], [], color=PHOSPHOR_GREEN, linewidth=2, alpha=0.9)
+waveform_glow, = ax2.plot([], [], color=PHOSPHOR_GREEN, linewidth=4, alpha=0.3)
+waveform_readout = ax2.text(0.5, 0.97, '', transform=ax2.transAxes, color=PHOSPHOR_GREEN,
+                            fontsize=10, family='monospace', weight='bold',
+                            horizontalalignment='center', verticalalignment='top')
+
+# EFFECTS DISPLAY (ax3)
+ax3.set_facecolor('#000000')
+ax3.set_xlim(0, 10)
+ax3.set_ylim(0, 15)
+ax3.axis('off')
+ax3.set_title('◢◤ EFFECTS RACK ◥◣', color=PHOSPHOR_GREEN, 
+             fontsize=14, family='monospace', weight='bold', pad=10)
+
+def effects_rack_columns():
+    """Current effect values as (name, value, max, color) rows for each rack column"""
     effects_left = [
         ("HARMONICS", harmonics_level, 1.0, AMBER),
         ("DISTORTION", distortion_level, 1.0, AMBER),
@@ -699,52 +864,140 @@ def animate(frame):
         ("VOLUME", volume, 0.8, PHOSPHOR_GREEN),
     ]
     
-    # Draw left column
+    return effects_left, effects_right
+
+def format_rack_row(name, value, max_val, name_width, bar_name_width, numeric_names):
+    """Text for one effects rack row: a plain number or a block-character bar"""
+    if name in numeric_names:
+        return f"{name:{name_width}s} {value:.1f}" if name != "BIT DEPTH" else f"{name:{name_width}s} {int(value)}"
+    
+    bar_length = int((value / max_val) * 10)
+    bar = '█' * bar_length + '░' * (10 - bar_length)
+    return f"{name:{bar_name_width}s} {bar} {value:.1f}"
+
+# Column layout: x position, name widths and which rows show a plain number
+RACK_COLUMNS = [
+    (0.2, 12, 10, ["CHR RATE", "DELAY TIME", "TREM RATE", "BIT DEPTH"]),
+    (5.5, 10, 8, ["TREM RATE", "BIT DEPTH"]),
+]
+
+# One text artist per rack row, positioned once
+rack_texts = []
+for (x_pos, _, _, _), rows in zip(RACK_COLUMNS, effects_rack_columns()):
+    column_texts = []
     y_pos = 14
-    for name, value, max_val, color in effects_left:
+    for name, value, max_val, color in rows:
         if name == "":  # Spacer
             y_pos -= 0.8
             continue
         
-        if name in ["CHR RATE", "DELAY TIME", "TREM RATE", "BIT DEPTH"]:
-            text = f"{name:12s} {value:.1f}" if name != "BIT DEPTH" else f"{name:12s} {int(value)}"
-        else:
-            bar_length = int((value / max_val) * 10)
-            bar = '█' * bar_length + '░' * (10 - bar_length)
-            text = f"{name:10s} {bar} {value:.1f}"
-        
-        ax3.text(0.2, y_pos, text, color=color, fontsize=9.5, 
-                family='monospace', weight='bold', verticalalignment='top')
+        column_texts.append(ax3.text(x_pos, y_pos, '', color=color, fontsize=9.5, 
+                                     family='monospace', weight='bold', verticalalignment='top'))
         y_pos -= 1.7
+    rack_texts.append(column_texts)
+
+def animate(frame):
+    global current_freq, current_waveform, target_freq
+    global joy_x_value, joy_y_value, last_x_value, last_y_value
+    global target_filter_cutoff, spectrogram_index, spectrogram_filled, serial_remainder
+    
+    # Read serial data: drain the port in one call and keep any trailing
+    # partial line for the next frame
+    waiting = arduino.in_waiting
+    if waiting > 0:
+        lines = (serial_remainder + arduino.read(waiting)).split(b'\n')
+        serial_remainder = lines.pop()
+        
+        latest = None
+        for line in lines:
+            parts = line.split(b',')
+            if len(parts) < 4:
+                continue
+            
+            # int() parses ASCII bytes directly and ignores the trailing \r
+            try:
+                freq = int(parts[0])
+                x_value = int(parts[1])
+                y_value = int(parts[2])
+                waveform_type = int(parts[3])
+            except ValueError:
+                continue
+            
+            # Every packet goes into the spectrogram history
+            row = (freq, x_value, y_value)
+            spectrogram_buffer[spectrogram_index] = row
+            spectrogram_buffer[spectrogram_index + SPECTROGRAM_LENGTH] = row
+            spectrogram_index = (spectrogram_index + 1) % SPECTROGRAM_LENGTH
+            spectrogram_filled = min(SPECTROGRAM_LENGTH, spectrogram_filled + 1)
+            
+            latest = (freq, x_value, y_value, waveform_type)
+        
+        # Only the most recent packet sets the synth state
+        if latest is not None:
+            freq, x_value, y_value, waveform_type = latest
+            
+            # Update state
+            waveform_type = waveform_type % 8
+            target_freq = freq
+            current_waveform = waveform_type
+            joy_x_value = x_value
+            joy_y_value = y_value
+            
+            # Map Y-axis to filter cutoff (inverted: up = brighter, down = darker)
+            target_filter_cutoff = np.interp(y_value, [0, 1023], [0.1, 1.0])
     
-    # Draw right column
-    y_pos = 14
-    for name, value, max_val, color in effects_right:
-        if name == "":  # Spacer
-            y_pos -= 0.8
-            continue
+    # SPECTROGRAM (ax1)
+    if spectrogram_filled:
+        end = spectrogram_index + SPECTROGRAM_LENGTH
+        x_vals = spectrogram_x[:spectrogram_filled]
+        y_vals = spectrogram_buffer[end - spectrogram_filled:end, 0]
         
-        if name in ["TREM RATE", "BIT DEPTH"]:
-            text = f"{name:10s} {value:.1f}" if name != "BIT DEPTH" else f"{name:10s} {int(value)}"
+        spectrogram_line.set_data(x_vals, y_vals)
+        spectrogram_glow.set_data(x_vals, y_vals)
+    
+    # WAVEFORM (ax2)
+    display_freq = int(current_freq)
+    if display_freq > 0:
+        if current_waveform in _WAVETABLES:
+            wave = wavetable_preview(current_waveform)
+        elif current_waveform == 6:
+            # Follow the audio's PWM sweep without advancing it from the GUI thread
+            wave = _pwm_at(preview_x, 1.0, pwm_phase)
         else:
-            bar_length = int((value / max_val) * 10)
-            bar = '█' * bar_length + '░' * (10 - bar_length)
-            text = f"{name:8s} {bar} {value:.1f}"
+            # Noise changes over time, so it is regenerated every frame
+            wave = generate_base_waveform(preview_x, 1.0, current_waveform)
         
-        ax3.text(5.5, y_pos, text, color=color, fontsize=9.5, 
-                family='monospace', weight='bold', verticalalignment='top')
-        y_pos -= 1.7
+        waveform_line.set_data(preview_x, wave)
+        waveform_glow.set_data(preview_x, wave)
+        
+        joy_x_percent = int(joy_x_value / 1023.0 * 100)
+        joy_y_percent = int(joy_y_value / 1023.0 * 100)
+        waveform_readout.set_text(
+            f'{waveform_names[current_waveform]} | {display_freq} Hz | X:{joy_x_percent}% Y:{joy_y_percent}%')
+    else:
+        waveform_line.set_data([], [])
+        waveform_glow.set_data([], [])
+    
+    # EFFECTS DISPLAY (ax3), only re-laying out rows whose text changed
+    for (_, name_width, bar_name_width, numeric_names), rows, texts in zip(
+            RACK_COLUMNS, effects_rack_columns(), rack_texts):
+        rows = [row for row in rows if row[0] != ""]
+        for (name, value, max_val, color), text_artist in zip(rows, texts):
+            text = format_rack_row(name, value, max_val, name_width, bar_name_width, numeric_names)
+            if text != text_artist.get_text():
+                text_artist.set_text(text)
     
-    ax3.set_title('◢◤ EFFECTS RACK ◥◣', color=PHOSPHOR_GREEN, 
-                 fontsize=14, family='monospace', weight='bold', pad=10)
+    return [spectrogram_line, spectrogram_glow, waveform_line, waveform_glow, waveform_readout,
+            *rack_texts[0], *rack_texts[1]]
 
 # Animation
-ani = animation.FuncAnimation(fig, animate, interval=30, blit=False)
+ani = animation.FuncAnimation(fig, animate, interval=30, blit=True)
 
 plt.tight_layout()
 plt.show()
 
 # Cleanup
+stop_dsp_worker()
 stream.stop()
 stream.close()
 arduino.close()
\ No newline at end of file